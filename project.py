@@ -1,11 +1,10 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
 import math
 import pandas as pd
 import random as r 
-
-# Creating a cache for storing the MSE values
-mse_cache = {}
+from numba import njit, prange
 
 # Load the data
 def import_csv(filename):
@@ -19,27 +18,27 @@ def import_csv(filename):
         points (numpy.ndarray): An array containing the sorted and shifted points.
         
     The function does the following:
-    1. Reads the CSV and extracts points as tuples.
-    2. Converts the list of tuples to a NumPy array.
+    1. Reads the CSV and splits the coordinates of every row at once.
+    2. Converts the split columns to a float32 NumPy array (halving the memory traffic of every scan over them).
+       Single precision keeps about 7 significant digits, so the coordinates should be local (e.g. meters around the
+       room) rather than large-offset ones such as UTM, which should be shifted to a local origin beforehand.
     3. Computes the mean point in the XY plane.
     4. Sorts the points based on their angles with respect to the mean point.
     5. Shifts the indices of the points based on their proximity to the mean x-coordinate.
     """
         
-    points = []
     data = pd.read_csv(filename)
-    for i, row in data.iterrows():
-        point = (row['X'].split()[0], row['X'].split()[1], row['X'].split()[2])
-        points.append(point)
-        
-    points = np.array(points).astype(float)
+    # Split all the rows at once into x, y, z columns
+    points = data['X'].str.split(n=2, expand=True).to_numpy(dtype=np.float32)
 
     # "ANGLE-SORTING"
     # Compute the mean of the points in the XY plane
     mean_point = np.mean(points[:, :2], axis=0)
 
     # Compute the angle for each point with respect to the mean point
-    angles = [math.atan2(p[1] - mean_point[1], p[0] - mean_point[0]) for p in points[:, :2]]
+    dx = points[:, 0] - mean_point[0]
+    dy = points[:, 1] - mean_point[1]
+    angles = np.arctan2(dy, dx)
     
     # Sort the points based on these angles
     sorted_indices = np.argsort(angles)
@@ -137,24 +136,10 @@ def generate_3d_rectangle(num_points=1000):
     return points
 """
 
-# Euclidean distance squered
-def euc_dist(a, b):
-    """
-    Calculate the squared Euclidean distance between two points in a 2D space.
-    
-    Input:
-        a (tuple): The coordinates (x, y) of the first point.
-        b (tuple): The coordinates (x, y) of the second point.
-        
-    Output:
-        float: The squared Euclidean distance between points a and b.
-    """
-
-    return (a[0]-b[0])**2 + (a[1]-b[1])**2
-
 def fit_parabola(x, y):
     """
-    Fit a parabola (quadratic polynomial) to the given data points using least squares linear regression.
+    Fit a parabola (quadratic polynomial) to the given data points using least squares linear regression,
+    by solving its normal equations directly.
     
     Parameters:
     x (numpy.ndarray): The x-coordinates of the data points.
@@ -164,67 +149,166 @@ def fit_parabola(x, y):
     numpy.ndarray: Coefficients [a, b, c] of the fitted parabola y = ax^2 + bx + c.
     """
 
-    # Construct the design matrix with columns [x^2, x, 1]
-    X = np.vstack([x**2, x, np.ones(len(x))]).T
+    # Less than 3 points do not determine a parabola, fall back to the minimal-norm least squares solution
+    if len(x) < 3:
+        X = np.vstack([x**2, x, np.ones(len(x))]).T
+        return np.linalg.lstsq(X, y, rcond=None)[0]
 
-    # Solve the least squares problem
-    a, b, c = np.linalg.lstsq(X, y, rcond=None)[0]
+    # Center x to keep the normal equations well conditioned
+    m = x.mean()
+    t = x - m
+    t2 = t * t
 
-    return np.array([a, b, c])
+    # Solve the 3x3 normal equations of the columns [t^2, t, 1]
+    st, st2, st3, st4 = t.sum(), t2.sum(), (t2 * t).sum(), (t2 * t2).sum()
+    A = np.array([[st4, st3, st2], [st3, st2, st], [st2, st, len(t)]])
+    B = np.array([(t2 * y).sum(), (t * y).sum(), np.sum(y)])
+    a, b, c = np.linalg.solve(A, B)
+
+    # Expand a(x - m)^2 + b(x - m) + c back to the coefficients of x
+    return np.array([a, b - 2*a*m, a*m*m - b*m + c])
 
 def generate_parab(u, v, distances):
     """
-    Generate a parabolic function based on a given range of indices and distances.
+    Fit a parabola to a given range of distances.
     
     Input:
-        start (int): The starting index for the subset of distances.
-        end (int): The ending index for the subset of distances.
+        u (int): The starting index for the subset of distances.
+        v (int): The ending index for the subset of distances.
         distances (numpy.ndarray): An array containing distances.
         
     Output:
-        parab (numpy.poly1d): A parabolic function fitted to the subset of distances.
+        coef (numpy.ndarray): Coefficients [a, b, c] of the parabola y = ax^2 + bx + c fitted to the subset of distances.
         
-    The function also uses a cache to store previously calculated parabolas to avoid redundant calculations.
+    The function is only used for plotting (each segment is fitted once), so its results are not cached.
+    The DP in segment gets the squared error of each segment from MSE instead.
     """
 
     # Calculate x and y based on start and end indices
-    x = np.array(range(u, v))
+    x = np.arange(u, v, dtype=np.float64)
     y = distances[u:v]
-    return np.poly1d(fit_parabola(x, y))
+    return fit_parabola(x, y)
 
-def MSE(u, v, distances):
+def prefix_sums(distances):
     """
-    Calculate the Mean Squared Error (MSE) between the observed distances and a parabolic fit.
+    Precompute the cumulative sums needed to fit a parabola to any range of distances in O(1).
     
     Input:
-        start (int): The starting index for the subset of distances.
-        end (int): The ending index for the subset of distances.
         distances (numpy.ndarray): An array containing distances.
-        parab (numpy.poly1d): A parabolic function to compare against.
+        
+    Output:
+        S (numpy.ndarray): A (4, n+1) array of cumulative sums (with a leading zero column) of
+            y, x*y, x^2*y and y^2 (x being the index of y in distances).
+    """
+
+    y = np.asarray(distances, dtype=np.float64)
+    n = len(y)
+    x = np.arange(n, dtype=np.float64)
+    terms = np.stack([y, x*y, x**2*y, y**2])
+    S = np.zeros((terms.shape[0], n + 1))
+    np.cumsum(terms, axis=1, out=S[:, 1:])
+    return S
+
+@njit(cache=True)
+def MSE(u, v, S):
+    """
+    Calculate the squared error between the observed distances in [u, v) and their least-squares parabola.
+    
+    Input:
+        u (int): The starting index for the subset of distances.
+        v (int): The ending index for the subset of distances.
+        S (numpy.ndarray): The cumulative sums returned by prefix_sums.
         
     Output:
         mse_value (float): The calculated MSE value.
         
-    The function uses a cache to store previously calculated MSE values to avoid redundant calculations.
+    The parabola is fitted in the centered coordinate t = x - (u+v-1)/2. Since x is an arithmetic progression,
+    the odd moments of t vanish and the even ones have closed forms, so only the weighted moments of y are read from S.
     """
-        
-    # Use u and v as the unique key for caching
-    key = (u, v)
-    
-    # Check if the result is already in the cache
-    if key in mse_cache:
-        return mse_cache[key]
-    
-    # Calculate x and y based on start and end indices
-    x = np.array(range(u, v))
-    y = distances[u:v]
+
+    m = v - u
+    # Moments of t (Faulhaber's formulas for a centered range of m consecutive integers)
+    # (computed in float, the int64 products overflow for segments of a few thousand points)
+    t0 = float(m)
+    t2 = t0 * (t0 * t0 - 1) / 12
+    t4 = t0 * (t0 * t0 - 1) * (3 * t0 * t0 - 7) / 240
+    # Weighted moments of y over [u, v), shifted to the centered coordinate
+    center = (u + v - 1) / 2
+    sy = S[0, v] - S[0, u]
+    sxy = S[1, v] - S[1, u]
+    sx2y = S[2, v] - S[2, u]
+    sty = sxy - center * sy
+    st2y = sx2y - 2 * center * sxy + center * center * sy
+
+    # Solve the normal equations [[t0, 0, t2], [0, t2, 0], [t2, 0, t4]] @ [c, b, a] = [sy, sty, st2y]
+    det = t0 * t4 - t2 * t2
+    c = (sy * t4 - t2 * st2y) / det
+    b = sty / t2
+    a = (t0 * st2y - t2 * sy) / det
+
+    # SSE = sum(y^2) - coef . rhs for the least-squares solution
+    return max(S[3, v] - S[3, u] - (c * sy + b * sty + a * st2y), 0.0)
+
+@njit(cache=True, parallel=True)
+def mse_table(S, n):
+    """
+    Tabulate the MSE of every segment of the distances.
     
-    # If not in cache, calculate the MSE and store in cache
-    parab = generate_parab(u, v, distances)
-    mse_value = np.sum((y - parab(x))**2)
-    mse_cache[key] = mse_value
+    Input:
+        S (numpy.ndarray): The cumulative sums returned by prefix_sums.
+        n (int): The total number of points.
+        
+    Output:
+        M (numpy.ndarray): M[v, u] is the MSE of the segment [u, v), or inf if it has less than 3 points.
+        
+    The table is indexed by the ending point first, so that the DP sweep over the starting points reads a contiguous row.
+    """
+
+    M = np.full((n+1, n+1), math.inf)
+    # The rows are independent, so they are filled in parallel
+    for v in prange(3, n + 1):
+        for u in range(v - 2):
+            M[v, u] = MSE(u, v, S)
+    return M
+
+@njit(cache=True, parallel=True)
+def segment_dp(M, n, k):
+    """
+    Fill the dynamic programming tables of segment.
     
-    return mse_value
+    Input:
+        M (numpy.ndarray): The MSE of every segment, as returned by mse_table.
+        n (int): The total number of points.
+        k (int): The number of segments.
+        
+    Output:
+        D (numpy.ndarray): D[v, length] is the minimal total MSE of splitting the first v points into length segments.
+        P (numpy.ndarray): P[v, length] is the starting point of the last segment in that split (-1 if there is none).
+    """
+
+    D = np.full((n+1, k+1), math.inf)
+    P = np.full((n+1, k+1), -1, dtype=np.int64)
+
+    D[0, 0] = 0
+
+    # The dynammic programming is done efficiently using the calculations of previous length
+    for length in range(1, k + 1):
+        # Iterate over each possible ending point of the segment
+        # (for a given length they only depend on the previous length, so they are processed in parallel)
+        for v in prange(length, n + 1):
+            # Total weight of each possible starting point of the segment, i.e. its MSE (weight) on top of the best split before it
+            # (segments with not enough points to fit a parabola have an infinite MSE)
+            costs = D[:v - length + 1, length - 1] + M[v, :v - length + 1]
+            
+            # always keep the best
+            min_index = np.argmin(costs)
+
+            # Update phase in the DP (only if there is a valid segmentation)
+            if costs[min_index] < math.inf:
+                D[v, length] = costs[min_index]
+                P[v, length] = min_index
+
+    return D, P
 
 # Find the path of length k
 def segment(n, k, distances):
@@ -242,34 +326,9 @@ def segment(n, k, distances):
     The function utilizes dynamic programming to efficiently find the best segmentation based on MSE.
     """
         
-    D = np.full((n+1, k+1), np.inf)
-    P = np.full((n+1, k+1), -1)
+    M = mse_table(prefix_sums(distances), n)
 
-    D[0, 0] = 0
-
-    # The dynammic programming is done efficiently using the calculations of previous length
-    for length in range(1, k + 1):
-        # Iterate over each possible ending point of the segment
-        for v in range(length, n + 1):
-            min_dist = np.inf
-            min_index = -1
-            
-            # Iterate over each possible starting point of the segment
-            for u in range(v - length + 1):
-                if v - u < 3: # Skip if not enough points to fit a parabola
-                    continue
-
-                # Generate parabola (if didn't already) for the segment and calculate its MSE (weight)
-                mse = MSE(u, v, distances)
-                
-                # always keep the best
-                if D[u, length - 1] + mse < min_dist:
-                    min_dist = D[u, length - 1] + mse
-                    min_index = u
-
-            # Update phase in the DP    
-            D[v, length] = min_dist
-            P[v, length] = min_index
+    D, P = segment_dp(M, n, k)
 
     # Reconstruction phase
     path = []
@@ -280,7 +339,7 @@ def segment(n, k, distances):
     path.reverse()
     return path
 
-def ransac_z_fit(floorCeil, points, iterations=300, threshold=0.5):
+def ransac_z_fit(floorCeil, points, iterations=300, threshold=0.5, block_size=32, rng=None):
     """
     Perform modified-RANSAC to find the most frequent z-coordinate within a given threshold with priority to high (ceil) and low (floor) points.
     
@@ -289,6 +348,8 @@ def ransac_z_fit(floorCeil, points, iterations=300, threshold=0.5):
         points (numpy.ndarray): An array containing 3D points.
         iterations (int): The number of iterations for RANSAC. Default is 300.
         threshold (float): The distance threshold for inliers. Default is 0.5.
+        block_size (int): The number of candidates whose inliers are counted together. Default is 32.
+        rng (numpy.random.Generator): The random generator used for sampling. Default is None (a new default_rng()).
         
     Output:
         best_z (float): The z-coordinate with the most inliers (also considering priorities).
@@ -300,23 +361,23 @@ def ransac_z_fit(floorCeil, points, iterations=300, threshold=0.5):
     bott = points[points[:, 2] < med]
     upp = points[points[:, 2] >= med]
 
-    best_z = None
-    best_inliers = -np.inf
-    for _ in range(iterations):
-        # Randomly sample a point
-        if(floorCeil == 1):
-            sample = points[np.random.choice(upp.shape[0], 1, replace=False)]
-        else:
-            sample = points[np.random.choice(bott.shape[0], 1, replace=False)]
-
-        sample_z = floorCeil * sample[0, 2]
-        
-        # Count inliers within the threshold
-        inliers = np.sum(np.abs(floorCeil * points[:, 2] - sample_z) < threshold) * sample_z # give weight according to height
-        
-        if inliers > best_inliers:
-            best_inliers = inliers
-            best_z = sample_z
+    # Randomly sample all the candidate points at once
+    if rng is None:
+        rng = np.random.default_rng()
+    if(floorCeil == 1):
+        samples = rng.integers(0, upp.shape[0], size=iterations)
+    else:
+        samples = rng.integers(0, bott.shape[0], size=iterations)
+    samples_z = floorCeil * points[samples, 2]
+
+    # Count inliers within the threshold for a block of candidates at a time (bounding the (block, N) comparison matrix)
+    z = floorCeil * points[:, 2]
+    inliers = np.empty(iterations)
+    for i in range(0, iterations, block_size):
+        block = samples_z[i:i + block_size]
+        inliers[i:i + block_size] = np.count_nonzero(np.abs(z[None, :] - block[:, None]) < threshold, axis=1) * block # give weight according to height
+
+    best_z = np.float64(samples_z[np.argmax(inliers)])
     
     return best_z
 
@@ -334,63 +395,40 @@ def plot_parab(range_start, range_end, distances):
         Y (numpy.ndarray): The y values for plotting, based on the parabolic fit.
     """
         
-    x = np.arange(range_start, range_end + 1)
-    parab = generate_parab(range_start, range_end, distances)
-    Y = parab(x)
+    x = np.arange(range_start, range_end + 1, dtype=np.float64)
+    a, b, c = generate_parab(range_start, range_end, distances)
+    Y = (a*x + b)*x + c
     return x, Y
 
-def bounding_box_3d(points):
+def plot_2d_segmentation(points, path, rectangle):
     """
-    Compute and visualize a 3D bounding box for a set of points.
+    Plot the 2D bounding box estimation in the XY plane.
     
     Input:
         points (numpy.ndarray): An array containing 3D points.
-        
-    Output:
-        rectangle_3d (list): A list of tuples representing the 3D bounding box corners.
-        
-    The function performs the following tasks:
-    1. Estimates a 2D bounding box in the XY plane using a dynamic programming approach.
-    2. Visualizes the 2D bounding box and the segmented parabolas.
-    3. Estimates the floor and ceiling heights using RANSAC.
-    4. Constructs and returns the 3D bounding box.
+        path (list): The indices of the segmentation, as returned by segment.
+        rectangle (list): The corners of the 2D bounding box.
     """
 
-    n = len(points)
-    k = 4
-
-    # Calculate the mean of the XY coordinates
-    c_mean = points[:, :2].mean(axis=0)
-    # Compute distances from each point to the mean point
-    distances = [euc_dist(points[i, :2], c_mean) for i in range(n)]
-    # Segment the distances into k segments using the dynamic programming approach
-    path = segment(n, k, distances)
-    path_points = points[path]
-
-    # Define the corners of the 2D rectangle in XY plane
-    sorted_indices = np.argsort(path_points[:, 0])
-    path_x = path_points[sorted_indices]
-    sorted_indices = np.argsort(path_points[:, 1])
-    path_y = path_points[sorted_indices]
-    avg = lambda x, y: (x+y)/2
-    lower_left = (avg(path_x[0][0], path_x[1][0]), avg(path_y[0][1], path_y[1][1]))
-    lower_right = (avg(path_x[2][0], path_x[3][0]), avg(path_y[0][1], path_y[1][1]))
-    upper_right = (avg(path_x[2][0], path_x[3][0]), avg(path_y[2][1], path_y[3][1]))
-    upper_left = (avg(path_x[0][0], path_x[1][0]), avg(path_y[2][1], path_y[3][1]))
-
-    rectangle = [lower_left, lower_right, upper_right, upper_left]
-
-    # Visualization of 2D bounding box estimation
     plt.scatter(points[:, 0], points[:, 1], s=5)
     # Red edges (estimation from the parabolas themselves)
     plt.plot(points[path, 0], points[path, 1], color='red', linestyle = '--')
     plt.plot([points[path[-1], 0], points[path[0], 0]], [points[path[-1], 1], points[path[0], 1]], color='red', linestyle='--')
     # Green rectangle (returned rectangle - "mean" rectangle derived from the red shape)
-    rectangle_points = np.array(rectangle + [lower_left]) 
+    rectangle_points = np.array(rectangle + [rectangle[0]]) 
     plt.plot(rectangle_points[:, 0], rectangle_points[:, 1], color='green')
     plt.show()
 
-    # Plotting the signal function
+def plot_signal(distances, path):
+    """
+    Plot the signal function (the distances) along with the parabolas of its segmentation.
+    
+    Input:
+        distances (numpy.ndarray): An array containing distances.
+        path (list): The indices of the segmentation, as returned by segment.
+    """
+
+    n = len(distances)
     plt.scatter(np.linspace(1, n, n), distances)
 
     # Plotting the parabola for the first segment
@@ -403,13 +441,66 @@ def bounding_box_3d(points):
         plt.plot(x, y)
 
     # Plotting the last parabola
-    x, y = plot_parab(path[-1], len(distances) - 1, distances)
+    x, y = plot_parab(path[-1], n - 1, distances)
     plt.plot(x, y)
     plt.show()
 
+def bounding_box_3d(points, visualize=False, rng=None):
+    """
+    Compute (and optionally visualize) a 3D bounding box for a set of points.
+    
+    Input:
+        points (numpy.ndarray): An array containing 3D points.
+        visualize (bool): Whether to plot the 2D bounding box and the segmented parabolas. Default is False.
+        rng (numpy.random.Generator): The random generator used by RANSAC. Default is None (a new default_rng()).
+        
+    Output:
+        rectangle_3d (list): A list of tuples representing the 3D bounding box corners.
+        
+    The function performs the following tasks:
+    1. Estimates a 2D bounding box in the XY plane using a dynamic programming approach.
+    2. Visualizes the 2D bounding box and the segmented parabolas (if visualize is set).
+    3. Estimates the floor and ceiling heights using RANSAC.
+    4. Constructs and returns the 3D bounding box.
+    """
+
+    n = len(points)
+    k = 4
+
+    # Calculate the mean of the XY coordinates (in float64, the points may be stored in float32)
+    xy = points[:, :2].astype(np.float64)
+    c_mean = xy.mean(axis=0)
+    # Compute the squared Euclidean distances from each point to the mean point
+    diff = xy - c_mean
+    distances = np.einsum('ij,ij->i', diff, diff)
+    # Segment the distances into k segments using the dynamic programming approach
+    path = segment(n, k, distances)
+    path_points = xy[path]
+
+    # Define the corners of the 2D rectangle in XY plane
+    # (each side is the average of the two smallest/largest coordinates of the path, no full sort needed)
+    path_x = path_points[np.argpartition(path_points[:, 0], 2), 0]
+    path_y = path_points[np.argpartition(path_points[:, 1], 2), 1]
+    left, right = (path_x[0] + path_x[1])/2, (path_x[2] + path_x[3])/2
+    bottom, top = (path_y[0] + path_y[1])/2, (path_y[2] + path_y[3])/2
+    lower_left = (left, bottom)
+    lower_right = (right, bottom)
+    upper_right = (right, top)
+    upper_left = (left, top)
+
+    rectangle = [lower_left, lower_right, upper_right, upper_left]
+
+    if visualize:
+        plot_2d_segmentation(points, path, rectangle)
+        plot_signal(distances, path)
+
     # RANSAC-based estimation of floor and ceiling heights
-    floor_z = ransac_z_fit(-1, points[points[:, 2] < np.median(points[:, 2])])
-    ceiling_z = ransac_z_fit(1, points[points[:, 2] > np.median(points[:, 2])])
+    z = points[:, 2]
+    med = np.median(z)
+    if rng is None:
+        rng = np.random.default_rng()
+    floor_z = ransac_z_fit(-1, points[z < med], rng=rng)
+    ceiling_z = ransac_z_fit(1, points[z > med], rng=rng)
 
     # Construct 3D bounding box
     rectangle_3d = [
@@ -428,31 +519,24 @@ def bounding_box_3d(points):
 
 # NOTE: End of auxiliary functions, start of execution.
 
-# Please note that we left an option to test the algorithm on synthetic data, 
-# to do so, replace the import function with the commented example below.
-points_3d = import_csv("map.csv") # generate_3d_rectangle(amount_of_points)
-estimated_bounding_box = bounding_box_3d(points_3d)
-
-
-# Visualisation
-fig = plt.figure()
-ax = fig.add_subplot(111, projection='3d')
-ax.scatter(points_3d[:, 0], points_3d[:, 1], points_3d[:, 2], c='blue', marker='o', s=40, label="Points")
-for i in range(4):
-    ax.plot([estimated_bounding_box[i][0], estimated_bounding_box[i+4][0]], 
-            [estimated_bounding_box[i][1], estimated_bounding_box[i+4][1]], 
-            [estimated_bounding_box[i][2], estimated_bounding_box[i+4][2]], c='green')
-for i in range(4):
-    ax.plot([estimated_bounding_box[i][0], estimated_bounding_box[(i+1)%4][0]], 
-            [estimated_bounding_box[i][1], estimated_bounding_box[(i+1)%4][1]], 
-            [estimated_bounding_box[i][2], estimated_bounding_box[(i+1)%4][2]], c='green')
-for i in range(4):
-    ax.plot([estimated_bounding_box[i+4][0], estimated_bounding_box[(i+1)%4+4][0]], 
-            [estimated_bounding_box[i+4][1], estimated_bounding_box[(i+1)%4+4][1]], 
-            [estimated_bounding_box[i+4][2], estimated_bounding_box[(i+1)%4+4][2]], c='green')
-ax.set_xlabel('X')
-ax.set_ylabel('Y')
-ax.set_zlabel('Z')
-ax.set_title("Estimated 3D room")
-ax.legend()
-plt.show()
\ No newline at end of file
+if __name__ == "__main__":
+    # Please note that we left an option to test the algorithm on synthetic data, 
+    # to do so, replace the import function with the commented example below.
+    points_3d = import_csv("map.csv") # generate_3d_rectangle(amount_of_points)
+    estimated_bounding_box = bounding_box_3d(points_3d, visualize=True)
+
+
+    # Visualisation
+    fig = plt.figure()
+    ax = fig.add_subplot(111, projection='3d')
+    ax.scatter(points_3d[:, 0], points_3d[:, 1], points_3d[:, 2], c='blue', marker='o', s=40, label="Points")
+    # Vertical, floor and ceiling edges of the box, drawn as a single collection
+    corners = np.array(estimated_bounding_box, dtype=float)
+    edges = [(i, i+4) for i in range(4)] + [(i, (i+1)%4) for i in range(4)] + [(i+4, (i+1)%4+4) for i in range(4)]
+    ax.add_collection3d(Line3DCollection(corners[edges], colors='green'))
+    ax.set_xlabel('X')
+    ax.set_ylabel('Y')
+    ax.set_zlabel('Z')
+    ax.set_title("Estimated 3D room")
+    ax.legend()
+    plt.show()